@@ -1,16 +1,46 @@
 import click
 import logging
+import time
+from tabulate import tabulate
 from src.app.web_crawler import WebCrawlerManager
+from src.app.reprocessor import Reprocessor
+from src.app.distributed import CrawlCoordinator, CrawlWorkerNode
+from src.app.fetcher.fetcher import FETCH_BACKENDS
 from src.utils.logger import setup_logger
 from src.utils import MetricsPubSub, tsv_util, file_io, with_progress_bar, normalize_and_validate_url
 
-@click.command()
+def _export_link_graph(source, results, logger):
+    graph = source.link_graph.build()
+    rank = graph.pagerank()
+    graph_path = file_io.save_link_graph(results.root_url, graph, rank)
+    logger.info(f"Link graph written to {graph_path}")
+    logger.info(graph.format_summary(rank=rank))
+
+class DefaultCommandGroup(click.Group):
+    """Command group that runs its default command when no command name is given."""
+
+    def __init__(self, *args, default_command: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx, args):
+        # Keeps `main.py <url> <max_depth>` working as `main.py crawl <url> <max_depth>`
+        if args and args[0] not in self.commands and not args[0].startswith('-'):
+            args.insert(0, self.default_command)
+        return super().parse_args(ctx, args)
+
+@click.group(cls=DefaultCommandGroup, default_command='crawl')
+def cli():
+    """Asynchronous web crawler. Without a command, crawls URL down to MAX_DEPTH."""
+
+@cli.command()
 @click.argument('url', callback=lambda ctx, param, value: normalize_and_validate_url(value))
 @click.argument('max_depth', type=click.IntRange(min=1))
-def main(url, max_depth):
+def crawl(url, max_depth):
+    """Crawl URL down to MAX_DEPTH and write the TSV report."""
     logger = setup_logger('webcrawler')
     metrics = MetricsPubSub()
-    
+
     try:
         crawler = WebCrawlerManager(url, max_depth, logger, metrics)
         results = with_progress_bar(
@@ -19,10 +49,100 @@ def main(url, max_depth):
         )
         output_path = file_io.save_crawl_results(results)
         logger.info(f"Report written to {output_path}")
+        _export_link_graph(crawler, results, logger)
         tsv_util.display(results)
     except Exception as e:
         logger.error(f"Crawl failed: {str(e)}")
         raise click.Abort()
 
+@cli.command()
+@click.argument('job_dir', type=click.Path(exists=True, file_okay=False))
+@click.option('--jobs', '-j', 'n_jobs', type=int, default=-1, help="Worker processes (-1 for one per CPU)")
+def reprocess(job_dir, n_jobs):
+    """Re-run extraction and reporting over the pages stored in JOB_DIR, without network access."""
+    logger = setup_logger('webcrawler')
+
+    try:
+        reprocessor = Reprocessor(job_dir, logger, n_jobs)
+        results = with_progress_bar(
+            operation=reprocessor.run,
+            desc=f"Reprocessing {job_dir}"
+        )
+        output_path = file_io.save_crawl_results(results)
+        logger.info(f"Report written to {output_path}")
+        _export_link_graph(reprocessor, results, logger)
+        tsv_util.display(results)
+    except Exception as e:
+        logger.error(f"Reprocess failed: {str(e)}")
+        raise click.Abort()
+
+@cli.command()
+@click.argument('url', callback=lambda ctx, param, value: normalize_and_validate_url(value))
+@click.argument('max_depth', type=click.IntRange(min=1))
+@click.option('--host', default='127.0.0.1', show_default=True, help="Interface to listen on")
+@click.option('--port', type=int, default=8700, show_default=True, help="Port to listen on")
+def coordinator(url, max_depth, host, port):
+    """Coordinate a distributed crawl of URL, served to worker nodes."""
+    logger = setup_logger('webcrawler')
+    metrics = MetricsPubSub()
+
+    try:
+        crawl_coordinator = CrawlCoordinator(url, max_depth, logger, metrics, host, port)
+        results = crawl_coordinator.crawl()
+        output_path = file_io.save_crawl_results(results)
+        logger.info(f"Report written to {output_path}")
+        _export_link_graph(crawl_coordinator, results, logger)
+        tsv_util.display(results)
+    except Exception as e:
+        logger.error(f"Crawl failed: {str(e)}")
+        raise click.Abort()
+
+@cli.command()
+@click.argument('coordinator_url')
+@click.option('--worker-id', default=None, help="Worker name reported to the coordinator")
+def worker(coordinator_url, worker_id):
+    """Crawl URLs leased from the coordinator at COORDINATOR_URL."""
+    logger = setup_logger('webcrawler')
+    metrics = MetricsPubSub()
+
+    try:
+        CrawlWorkerNode(coordinator_url, logger, metrics, worker_id).run()
+    except Exception as e:
+        logger.error(f"Worker failed: {str(e)}")
+        raise click.Abort()
+
+@cli.command()
+@click.argument('url', callback=lambda ctx, param, value: normalize_and_validate_url(value))
+@click.argument('max_depth', type=click.IntRange(min=1))
+@click.option('--backend', '-b', 'backends', type=click.Choice(FETCH_BACKENDS), multiple=True, help="Fetch backend to compare, repeatable (default: all)")
+@click.option('--rounds', type=click.IntRange(min=1), default=1, show_default=True, help="Crawls per backend, interleaved across backends")
+@click.option('--scrape/--no-scrape', default=False, show_default=True, help="Include browser rendering in the measurement")
+def benchmark(url, max_depth, backends, rounds, scrape):
+    """Compare fetch backends on the same crawl of URL down to MAX_DEPTH."""
+    logger = setup_logger('webcrawler')
+    logger.setLevel(logging.WARNING)
+    backends = backends or FETCH_BACKENDS
+    totals = {backend: {'pages': 0, 'failed': 0, 'seconds': 0.0} for backend in backends}
+
+    for _ in range(rounds):
+        for backend in backends:
+            crawler = WebCrawlerManager(url, max_depth, logger, MetricsPubSub(), fetch_backend=backend, scrape=scrape)
+            start = time.perf_counter()
+            results = crawler.crawl()
+            totals[backend]['seconds'] += time.perf_counter() - start
+            totals[backend]['pages'] += len(results.crawled_pages)
+            totals[backend]['failed'] += sum(1 for page in results.crawled_pages.values() if not page.success)
+
+    rows = [['Backend', 'Pages', 'Failed', 'Seconds', 'Pages/sec']]
+    for backend, total in totals.items():
+        rows.append([
+            backend,
+            str(total['pages'] // rounds),
+            str(total['failed'] // rounds),
+            f"{total['seconds'] / rounds:.2f}",
+            f"{total['pages'] / (total['seconds'] or 1):.1f}"
+        ])
+    click.echo(tabulate(rows, headers='firstrow'))
+
 if __name__ == "__main__":
-    main()
+    cli()
@@ -0,0 +1,7 @@
+from .coordinator import CrawlCoordinator
+from .worker_node import CrawlWorkerNode
+
+__all__ = [
+    'CrawlCoordinator',
+    'CrawlWorkerNode',
+]
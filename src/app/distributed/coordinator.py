@@ -0,0 +1,151 @@
+import asyncio
+import heapq
+import logging
+import datetime
+import time
+import uuid
+from typing import Dict, List, Tuple
+
+from aiohttp import web
+
+from ..models import CrawlProcessResult, CrawlPageResult, LeasedUrl, UrlLease
+from ..web_crawler import CrawlFrontier
+from ...utils import Config, get_domain
+from ...utils.metrics_pubsub import MetricsPubSub
+
+
+class CrawlCoordinator(CrawlFrontier):
+    """Owns the frontier, seen-set and per-host politeness state of a distributed crawl.
+
+    Worker nodes lease URL batches over HTTP and report page results back one by one.
+    URLs of leases that are not fully reported within the lease timeout are re-queued.
+    """
+
+    def __init__(self, root_url: str, max_depth: int, logger: logging.Logger, metrics: MetricsPubSub, host: str = '127.0.0.1', port: int = 8700):
+        super().__init__(root_url, max_depth, logger, metrics)
+        self.host = host
+        self.port = port
+        self.lease_timeout = Config.get_lease_timeout()
+        self.host_delay = Config.get_crawl_host_delay()
+
+        self.frontier: List[Tuple[int, str]] = []
+        # lease_id -> (deadline, worker_id, unreported url -> depth)
+        self.leases: Dict[str, Tuple[float, str, Dict[str, int]]] = {}
+        self.host_next_fetch: Dict[str, float] = {}
+        self._done = None
+
+    def crawl(self) -> CrawlProcessResult:
+        """Serve the coordinator until the crawl completes."""
+        return asyncio.run(self._serve())
+
+    async def _serve(self) -> CrawlProcessResult:
+        self.logger.info(f"Coordinating crawl from {self.root_url} with max depth {self.max_depth} on {self.host}:{self.port}")
+        self._done = asyncio.Event()
+        self._seed()
+
+        app = web.Application()
+        app.add_routes([
+            web.post('/lease', self._handle_lease),
+            web.post('/result', self._handle_result),
+            web.get('/status', self._handle_status),
+        ])
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, self.host, self.port).start()
+        reaper = asyncio.create_task(self._reap_expired_leases())
+        try:
+            await self._done.wait()
+            # Let polling workers see the crawl is done before shutting down
+            await asyncio.sleep(Config.get_lease_poll_interval() * 2)
+        finally:
+            reaper.cancel()
+            await runner.cleanup()
+
+        self.process_result.end_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.logger.info(self.process_result.format_completion())
+        return self.process_result
+
+    def _submit(self, url: str, depth: int) -> None:
+        heapq.heappush(self.frontier, (depth, url))
+
+    def _queue_size(self) -> int:
+        return len(self.frontier)
+
+    def _check_done(self) -> None:
+        if not self.frontier and not self.leases:
+            self._done.set()
+
+    def _lease_urls(self, max_urls: int) -> List[LeasedUrl]:
+        """Pop up to max_urls URLs whose hosts are not cooling down under the politeness delay."""
+        now = time.monotonic()
+        leased, deferred = [], []
+        # Bound the scan so a frontier dominated by throttled hosts stays cheap
+        scan_limit = max_urls * 10
+        while self.frontier and len(leased) < max_urls and scan_limit > 0:
+            scan_limit -= 1
+            depth, url = heapq.heappop(self.frontier)
+            host = get_domain(url)
+            if self.host_next_fetch.get(host, 0) > now:
+                deferred.append((depth, url))
+                continue
+            if self.host_delay:
+                self.host_next_fetch[host] = now + self.host_delay
+            leased.append(LeasedUrl(url=url, depth=depth))
+        for item in deferred:
+            heapq.heappush(self.frontier, item)
+        return leased
+
+    async def _handle_lease(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        worker_id = body.get('worker_id', 'unknown')
+        lease = UrlLease(root_url=self.root_url, done=self._done.is_set())
+        if not lease.done:
+            urls = self._lease_urls(int(body.get('max_urls', Config.get_lease_batch_size())))
+            if urls:
+                lease.lease_id = uuid.uuid4().hex
+                lease.urls = urls
+                lease.timeout = self.lease_timeout
+                self.leases[lease.lease_id] = (time.monotonic() + self.lease_timeout, worker_id, {u.url: u.depth for u in urls})
+                self.logger.debug(f"Leased {len(urls)} URLs to worker {worker_id} ({lease.lease_id})")
+        return web.json_response(lease.model_dump())
+
+    async def _handle_result(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        result = CrawlPageResult(**body['result'])
+        lease = self.leases.get(body.get('lease_id'))
+        if lease:
+            lease[2].pop(result.url, None)
+            if not lease[2]:
+                del self.leases[body['lease_id']]
+
+        # Results of expired leases are still accepted unless the URL was re-crawled already
+        if result.url not in self.process_result.crawled_pages:
+            if result.success:
+                self._on_page_parsed(result)
+            self._record_result(result)
+        self._check_done()
+        return web.json_response({})
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            'root_url': self.root_url,
+            'queued': len(self.frontier),
+            'leases': len(self.leases),
+            'leased_urls': sum(len(urls) for _, _, urls in self.leases.values()),
+            'crawled': len(self.process_result.crawled_pages),
+            'done': self._done.is_set()
+        })
+
+    async def _reap_expired_leases(self) -> None:
+        """Re-queue unreported URLs of leases held by dead or stalled workers."""
+        while True:
+            await asyncio.sleep(1)
+            now = time.monotonic()
+            for lease_id, (deadline, worker_id, urls) in list(self.leases.items()):
+                if deadline > now:
+                    continue
+                self.logger.warning(f"Lease {lease_id} of worker {worker_id} expired, re-queueing {len(urls)} URLs")
+                del self.leases[lease_id]
+                for url, depth in urls.items():
+                    self._submit(url, depth)
+            self._check_done()
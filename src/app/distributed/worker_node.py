@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import socket
+import uuid
+from typing import Optional, Set
+
+import aiohttp
+from urllib.parse import urlparse
+
+from ..models import LeasedUrl, UrlLease
+from ..scraper import Scraper
+from ..fetcher import create_fetcher
+from ..web_crawler.web_crawler_worker import WebCrawlerWorker
+from ...utils import Config, CachingResolver
+from ...utils.metrics_pubsub import MetricsPubSub
+
+MAX_COORDINATOR_RETRIES = 5
+
+
+class CrawlWorkerNode:
+    """Leases URL batches from a coordinator, crawls them and streams each page result back.
+
+    Up to LEASE_BATCH_SIZE URLs are in flight at once, with at most SCRAPE_CONCURRENCY browser renders.
+    """
+
+    def __init__(self, coordinator_url: str, logger: logging.Logger, metrics: MetricsPubSub, worker_id: Optional[str] = None):
+        self.coordinator_url = coordinator_url.rstrip('/')
+        self.logger = logger
+        self.metrics = metrics
+        self.worker_id = worker_id or f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self.batch_size = Config.get_lease_batch_size()
+        self.poll_interval = Config.get_lease_poll_interval()
+        self.headers = {'User-Agent': Config.get_user_agent()}
+        self.worker: Optional[WebCrawlerWorker] = None
+        self.resolver = CachingResolver()
+        self.fetcher = create_fetcher(Config.get_fetch_backend(), self.headers, Config.get_timeout(), self.resolver)
+
+    def run(self) -> int:
+        """Work until the coordinator reports the crawl is done. Returns the number of pages crawled."""
+        return asyncio.run(self._run_async())
+
+    def _get_worker(self, root_url: str) -> WebCrawlerWorker:
+        """Create the crawl worker on first lease, once the crawl's root URL is known."""
+        if self.worker is None:
+            self.worker = WebCrawlerWorker(
+                headers=self.headers,
+                timeout=Config.get_timeout(),
+                logger=self.logger,
+                scraper=Scraper(self.logger, self.metrics, root_url),
+                metrics=self.metrics,
+                resolver=self.resolver,
+                render_slots=asyncio.Semaphore(Config.get_scrape_concurrency())
+            )
+        return self.worker
+
+    async def _run_async(self) -> int:
+        self.logger.info(f"Worker {self.worker_id} connecting to {self.coordinator_url}")
+        crawled = 0
+        failures = 0
+        in_flight: Set[asyncio.Task] = set()
+        async with aiohttp.ClientSession() as session:
+            while True:
+                # Top up the rolling set of in-flight URLs once half of it has completed,
+                # rather than waiting for the slowest page of each lease
+                if len(in_flight) <= self.batch_size // 2:
+                    try:
+                        lease = await self._request_lease(session, self.batch_size - len(in_flight))
+                        failures = 0
+                    except aiohttp.ClientError as e:
+                        failures += 1
+                        if failures > MAX_COORDINATOR_RETRIES:
+                            self.logger.error(f"Giving up on coordinator {self.coordinator_url}: {str(e)}")
+                            break
+                        await asyncio.sleep(self.poll_interval * failures)
+                        continue
+
+                    if lease.done:
+                        break
+                    if lease.urls:
+                        worker = self._get_worker(lease.root_url)
+                        for leased in lease.urls:
+                            if self.fetcher.resolver is self.resolver:
+                                self.resolver.prefetch(urlparse(leased.url).hostname)
+                            in_flight.add(asyncio.create_task(self._process(session, worker, lease, leased)))
+
+                # Wait for a URL to complete; poll again after the interval while below the low-water mark
+                timeout = None if len(in_flight) > self.batch_size // 2 else self.poll_interval
+                if in_flight:
+                    done, in_flight = await asyncio.wait(in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    crawled += len(done)
+                else:
+                    await asyncio.sleep(timeout)
+
+            await asyncio.gather(*in_flight)
+            crawled += len(in_flight)
+
+        await self.fetcher.close()
+        await self.resolver.close()
+        self.logger.info(f"Worker {self.worker_id} finished after crawling {crawled:,d} URLs")
+        return crawled
+
+    async def _request_lease(self, session: aiohttp.ClientSession, max_urls: int) -> UrlLease:
+        async with session.post(
+            f"{self.coordinator_url}/lease",
+            json={'worker_id': self.worker_id, 'max_urls': max_urls}
+        ) as response:
+            response.raise_for_status()
+            return UrlLease(**await response.json())
+
+    async def _process(self, session: aiohttp.ClientSession, worker: WebCrawlerWorker, lease: UrlLease, leased: LeasedUrl) -> None:
+        """Crawl one leased URL and report its result; unreported URLs are re-leased after the lease timeout."""
+        result = await worker.crawl_url(leased.url, leased.depth, self.fetcher)
+        try:
+            async with session.post(
+                f"{self.coordinator_url}/result",
+                json={'lease_id': lease.lease_id, 'result': result.model_dump()}
+            ) as response:
+                response.raise_for_status()
+        except aiohttp.ClientError as e:
+            self.logger.error(f"Failed to report {leased.url} to coordinator: {str(e)}")
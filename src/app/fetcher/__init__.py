@@ -0,0 +1,8 @@
+from .fetcher import Fetcher, create_fetcher
+from .aiohttp_fetcher import AiohttpFetcher
+
+__all__ = [
+    'Fetcher',
+    'AiohttpFetcher',
+    'create_fetcher',
+]
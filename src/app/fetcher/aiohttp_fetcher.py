@@ -0,0 +1,35 @@
+from typing import Dict, Optional
+
+import aiohttp
+
+from .fetcher import Fetcher, ACCEPT_ENCODING
+from ...utils import CachingResolver
+
+
+class AiohttpFetcher(Fetcher):
+    """HTTP/1.1 fetcher on aiohttp, optionally reusing a caller-owned session."""
+
+    def __init__(self, headers: Dict[str, str], timeout: int, resolver: CachingResolver = None, session: Optional[aiohttp.ClientSession] = None):
+        self.headers = {'Accept-Encoding': ACCEPT_ENCODING, **headers}
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # A caller-owned session keeps its own connector and resolver
+        self.resolver = resolver if session is None else None
+        self.session = session
+        self._owns_session = session is None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily: sessions bind to the running event loop
+        if self.session is None:
+            connector = aiohttp.TCPConnector(resolver=self.resolver, use_dns_cache=False) if self.resolver else None
+            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self.session
+
+    async def fetch(self, url: str) -> str:
+        async with self._get_session().get(url, headers=self.headers, timeout=self.timeout) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    async def close(self) -> None:
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
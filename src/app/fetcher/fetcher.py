@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from ...utils import CachingResolver
+
+FETCH_BACKENDS = ('aiohttp', 'httpx')
+
+def _brotli_available() -> bool:
+    try:
+        import brotli  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+# Only advertise brotli when a decoder is installed for the client libraries to use
+ACCEPT_ENCODING = 'gzip, deflate, br' if _brotli_available() else 'gzip, deflate'
+
+
+class Fetcher(ABC):
+    """HTTP backend used by the crawl pipeline to download pages."""
+
+    # Shared resolver the backend looks hosts up through, None if it resolves on its own
+    resolver: Optional[CachingResolver] = None
+
+    @abstractmethod
+    async def fetch(self, url: str) -> str:
+        """Fetch a page and return its decoded body. Raises on HTTP error statuses."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections owned by the fetcher."""
+
+    async def __aenter__(self) -> 'Fetcher':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def create_fetcher(backend: str, headers: Dict[str, str], timeout: int, resolver: CachingResolver = None) -> Fetcher:
+    """Create a fetcher for the named backend: 'aiohttp' (HTTP/1.1) or 'httpx' (HTTP/2).
+
+    Only the aiohttp backend resolves hosts through the given resolver; httpx uses its own lookups.
+    """
+    if backend == 'aiohttp':
+        from .aiohttp_fetcher import AiohttpFetcher
+        return AiohttpFetcher(headers, timeout, resolver=resolver)
+    if backend == 'httpx':
+        from .httpx_fetcher import HttpxFetcher
+        return HttpxFetcher(headers, timeout)
+    raise ValueError(f"Unknown fetch backend '{backend}', expected one of: {', '.join(FETCH_BACKENDS)}")
@@ -0,0 +1,40 @@
+from typing import Dict, Optional
+
+import httpx
+
+from .fetcher import Fetcher, ACCEPT_ENCODING
+from ...utils import Config
+
+
+class HttpxFetcher(Fetcher):
+    """HTTP/2 fetcher on httpx, multiplexing concurrent requests to a host over one connection.
+
+    Falls back to HTTP/1.1 for servers that do not negotiate HTTP/2. Hosts are resolved by httpx
+    itself, so the crawl's shared DNS cache, negative caching and prefetch do not apply.
+    """
+
+    def __init__(self, headers: Dict[str, str], timeout: int):
+        self.headers = {'Accept-Encoding': ACCEPT_ENCODING, **headers}
+        self.timeout = httpx.Timeout(timeout)
+        self.client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=Config.get_max_batch_size())
+            )
+        return self.client
+
+    async def fetch(self, url: str) -> str:
+        response = await self._get_client().get(url)
+        response.raise_for_status()
+        return response.text
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
@@ -0,0 +1,6 @@
+from .link_graph import LinkGraph, LinkGraphBuilder
+
+__all__ = [
+    'LinkGraph',
+    'LinkGraphBuilder',
+]
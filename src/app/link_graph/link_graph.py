@@ -0,0 +1,153 @@
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ...utils.url_utils import get_domain
+
+
+class LinkGraph:
+    """Immutable link graph in CSR form: out-links of node i are indices[indptr[i]:indptr[i + 1]]."""
+
+    def __init__(self, urls: List[str], indptr: np.ndarray, indices: np.ndarray):
+        self.urls = urls
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def from_edges(cls, urls: List[str], sources: np.ndarray, targets: np.ndarray) -> 'LinkGraph':
+        """Build the CSR adjacency from parallel source/target ID arrays."""
+        n = len(urls)
+        order = np.argsort(sources, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        return cls(urls, indptr, targets[order].astype(np.uint32, copy=False))
+
+    @property
+    def node_count(self) -> int:
+        return len(self.urls)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+
+    def out_degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> np.ndarray:
+        return np.bincount(self.indices, minlength=self.node_count)
+
+    def pagerank(self, damping: float = 0.85, max_iter: int = 100, tol: float = 1e-6) -> np.ndarray:
+        """PageRank by power iteration; dangling nodes spread their rank uniformly."""
+        n = self.node_count
+        if n == 0:
+            return np.zeros(0)
+        out_degree = self.out_degree().astype(np.float64)
+        dangling = out_degree == 0
+        sources = np.repeat(np.arange(n), self.out_degree())
+        rank = np.full(n, 1.0 / n)
+        share = np.zeros(n)
+        for _ in range(max_iter):
+            np.divide(rank, out_degree, out=share, where=~dangling)
+            new_rank = np.bincount(self.indices, weights=share[sources], minlength=n)
+            new_rank = damping * (new_rank + rank[dangling].sum() / n) + (1 - damping) / n
+            converged = np.abs(new_rank - rank).sum() < tol
+            rank = new_rank
+            if converged:
+                break
+        return rank
+
+    def domain_ids(self) -> Tuple[List[str], np.ndarray]:
+        """Intern node domains. Returns the domain table and a per-node domain ID array."""
+        domain_table: Dict[str, int] = {}
+        ids = np.fromiter(
+            (domain_table.setdefault(get_domain(url), len(domain_table)) for url in self.urls),
+            dtype=np.int32,
+            count=self.node_count
+        )
+        return list(domain_table), ids
+
+    def domain_stats(self, rank: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Per-domain aggregates: page count, out/in links, intra-domain links and summed PageRank.
+
+        Pass a precomputed pagerank() result to avoid computing it again.
+        """
+        if rank is None:
+            rank = self.pagerank()
+        domains, node_domains = self.domain_ids()
+        n_domains = len(domains)
+        source_domains = np.repeat(node_domains, self.out_degree())
+        target_domains = node_domains[self.indices]
+        internal = source_domains == target_domains
+        return {
+            'domain': np.array(domains, dtype=object),
+            'pages': np.bincount(node_domains, minlength=n_domains),
+            'out_links': np.bincount(source_domains, minlength=n_domains),
+            'in_links': np.bincount(target_domains, minlength=n_domains),
+            'internal_links': np.bincount(source_domains[internal], minlength=n_domains),
+            'pagerank': np.bincount(node_domains, weights=rank, minlength=n_domains)
+        }
+
+    def save(self, path: Path) -> None:
+        """Export as a compressed NumPy archive, with URLs packed into one UTF-8 blob plus offsets."""
+        encoded = [url.encode('utf-8') for url in self.urls]
+        url_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(url) for url in encoded], out=url_offsets[1:])
+        np.savez_compressed(
+            path,
+            indptr=self.indptr,
+            indices=self.indices,
+            url_blob=np.frombuffer(b''.join(encoded), dtype=np.uint8),
+            url_offsets=url_offsets
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> 'LinkGraph':
+        """Load a graph written by save()."""
+        with np.load(path) as data:
+            blob = data['url_blob'].tobytes()
+            offsets = data['url_offsets']
+            urls = [blob[start:end].decode('utf-8') for start, end in zip(offsets[:-1], offsets[1:])]
+            return cls(urls, data['indptr'], data['indices'])
+
+    def format_summary(self, top: int = 5, rank: Optional[np.ndarray] = None) -> str:
+        """Format graph size and the highest PageRank pages, from a precomputed pagerank() result if given."""
+        if rank is None:
+            rank = self.pagerank()
+        best = np.argsort(rank)[::-1][:top]
+        lines = [f"Link graph: {self.node_count:,d} URLs, {self.edge_count:,d} links"]
+        lines += [f"- {rank[i]:.4f} {self.urls[i]}" for i in best]
+        return '\n'.join(lines)
+
+
+class LinkGraphBuilder:
+    """Incrementally interns URLs to integer IDs and collects edges in compact arrays."""
+
+    def __init__(self):
+        self.url_ids: Dict[str, int] = {}
+        self.urls: List[str] = []
+        self.sources = array('I')
+        self.targets = array('I')
+
+    def intern(self, url: str) -> int:
+        """Return the ID of a URL, assigning the next one if unseen."""
+        url_id = self.url_ids.get(url)
+        if url_id is None:
+            url_id = self.url_ids[url] = len(self.urls)
+            self.urls.append(url)
+        return url_id
+
+    def add_page(self, url: str, links: Iterable[str]) -> None:
+        """Record a crawled page and its out-links."""
+        source = self.intern(url)
+        for link in links:
+            self.sources.append(source)
+            self.targets.append(self.intern(link))
+
+    def build(self) -> LinkGraph:
+        return LinkGraph.from_edges(
+            list(self.urls),
+            np.frombuffer(self.sources, dtype=np.uint32).astype(np.int64),
+            np.frombuffer(self.targets, dtype=np.uint32)
+        )
@@ -1,5 +1,7 @@
 from .crawl_page_result import CrawlPageResult
 from .crawl_process_result import CrawlProcessResult
 from .metrics import MetricType
+from .scrape_profile import ScrapeProfile
+from .url_lease import LeasedUrl, UrlLease
 
-__all__ = ['CrawlPageResult', 'CrawlProcessResult', 'MetricType']
+__all__ = ['CrawlPageResult', 'CrawlProcessResult', 'MetricType', 'ScrapeProfile', 'LeasedUrl', 'UrlLease']
@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 
 class MetricType(str, Enum):
     URL_QUEUED = "url_queued"
+    URL_SUPPRESSED = "url_suppressed"
     URL_PROCESSING = "url_processing"
     URL_PROCESSED = "url_processed"
     URL_FAILED = "url_failed"
@@ -22,6 +23,7 @@ class CrawlerMetrics(BaseModel):
     
     # URL counts
     urls_queued: int = Field(default=0)
+    urls_suppressed: int = Field(default=0)
     urls_processing: int = Field(default=0)
     urls_processed: int = Field(default=0)
     urls_failed: int = Field(default=0)
@@ -48,6 +50,8 @@ class CrawlerMetrics(BaseModel):
         # Update counts based on metric type
         if metric_type == MetricType.URL_QUEUED:
             self.urls_queued += 1
+        elif metric_type == MetricType.URL_SUPPRESSED:
+            self.urls_suppressed += 1
         elif metric_type == MetricType.URL_PROCESSING:
             self.urls_processing += 1
             self.urls_queued = max(0, self.urls_queued - 1)
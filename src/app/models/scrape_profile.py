@@ -0,0 +1,80 @@
+import ipaddress
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, validator
+
+from ...utils.config import Config
+
+class ScrapeProfile(BaseModel):
+    """Browser navigation and request interception settings for a scrape."""
+
+    wait_until: Literal['commit', 'domcontentloaded', 'load', 'networkidle'] = Field(
+        default='networkidle',
+        description="Navigation event to wait for before extracting content"
+    )
+    wait_selector: Optional[str] = Field(
+        default=None,
+        description="CSS selector to wait for after navigation, if any"
+    )
+    js_enabled: bool = Field(
+        default=True,
+        description="Whether JavaScript runs on scraped pages"
+    )
+    blocked_resource_types: List[str] = Field(
+        default_factory=list,
+        description="Playwright resource types to abort (e.g. image, media, font)"
+    )
+    blocked_domains: List[str] = Field(
+        default_factory=list,
+        description="Domains (and their subdomains) whose requests are aborted"
+    )
+    block_third_party: bool = Field(
+        default=False,
+        description="Abort requests to hosts other than the scraped page's host"
+    )
+
+    @validator('blocked_resource_types', 'blocked_domains', pre=True)
+    def normalize_entries(cls, v):
+        """Lowercase entries and drop blanks."""
+        return [entry.strip().lower() for entry in v or [] if entry and entry.strip()]
+
+    @classmethod
+    def from_config(cls) -> 'ScrapeProfile':
+        """Build the profile from environment configuration."""
+        return cls(
+            wait_until=Config.get_scrape_wait_until(),
+            wait_selector=Config.get_scrape_wait_selector() or None,
+            js_enabled=Config.get_scrape_js_enabled(),
+            blocked_resource_types=Config.get_scrape_blocked_resource_types(),
+            blocked_domains=Config.get_scrape_blocked_domains(),
+            block_third_party=Config.get_scrape_block_third_party()
+        )
+
+    @property
+    def intercepts_requests(self) -> bool:
+        """Whether any request interception rule is active."""
+        return bool(self.blocked_resource_types or self.blocked_domains or self.block_third_party)
+
+    def should_block(self, resource_type: str, request_host: str, page_host: str) -> bool:
+        """Check if a request should be aborted under this profile."""
+        if resource_type in self.blocked_resource_types:
+            return True
+        request_host = request_host.lower()
+        if any(request_host == domain or request_host.endswith(f".{domain}") for domain in self.blocked_domains):
+            return True
+        if self.block_third_party and request_host and page_host:
+            return self._site(request_host) != self._site(page_host)
+        return False
+
+    @staticmethod
+    def _site(host: str) -> str:
+        """Approximate registrable domain, so static.example.com and blog.example.com are one site."""
+        host = host.lower()
+        try:
+            ipaddress.ip_address(host.strip('[]'))
+            return host
+        except ValueError:
+            pass
+        labels = host.split('.')
+        # Keep a third label under country-code second-level domains such as co.uk or com.au
+        keep = 3 if len(labels) >= 3 and len(labels[-1]) == 2 and len(labels[-2]) <= 3 else 2
+        return '.'.join(labels[-keep:])
@@ -0,0 +1,17 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+class LeasedUrl(BaseModel):
+    """A URL handed to a worker node as part of a lease."""
+
+    url: str = Field(description="URL to crawl")
+    depth: int = Field(description="Depth level in the crawl tree")
+
+class UrlLease(BaseModel):
+    """Batch of URLs leased by the coordinator to a worker node."""
+
+    lease_id: Optional[str] = Field(default=None, description="Lease identifier, None when no URLs were leased")
+    root_url: str = Field(description="Root URL of the crawl, used for scrape storage")
+    urls: List[LeasedUrl] = Field(default_factory=list, description="Leased URLs")
+    timeout: int = Field(default=0, description="Seconds before unreported URLs are re-leased to other workers")
+    done: bool = Field(default=False, description="Whether the crawl has finished and the worker should stop")
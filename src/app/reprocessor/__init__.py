@@ -0,0 +1,5 @@
+from .reprocessor import Reprocessor
+
+__all__ = [
+    'Reprocessor',
+]
@@ -0,0 +1,98 @@
+import logging
+import datetime
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+from bs4 import BeautifulSoup
+
+from ..models import CrawlProcessResult, CrawlPageResult
+from ..link_graph import LinkGraphBuilder
+from ..web_crawler.web_crawler_worker import WebCrawlerWorker
+from ...utils import Config
+from ...utils.file_io import load_scrape_index
+from ...utils.metrics_pubsub import MetricsPubSub
+
+# Per-process worker used for link extraction and classification
+_worker: Optional[WebCrawlerWorker] = None
+
+def _init_process() -> None:
+    """Create the extraction worker once per pool process."""
+    global _worker
+    _worker = WebCrawlerWorker(
+        headers={},
+        timeout=Config.get_timeout(),
+        logger=logging.getLogger('webcrawler.reprocess'),
+        scraper=None,
+        metrics=MetricsPubSub()
+    )
+
+def _recover_url(html_content: str) -> Optional[str]:
+    """Recover the page URL from canonical metadata, for pages stored without an index entry."""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    canonical = soup.find('link', rel='canonical', href=True)
+    if canonical:
+        return canonical['href']
+    og_url = soup.find('meta', property='og:url', content=True)
+    return og_url['content'] if og_url else None
+
+def _reprocess_page(entry: Dict) -> Union[CrawlPageResult, str]:
+    """Re-run extraction and classification for one stored page. Returns the reason if the page is skipped."""
+    try:
+        content = Path(entry['path']).read_text(errors='replace')
+    except OSError as e:
+        return f"cannot read stored page ({e.strerror or e})"
+    url = entry['url'] or _recover_url(content)
+    if not url:
+        return "original URL unknown"
+    depth = entry['depth'] or 0
+    try:
+        return _worker.parse(url, depth, content)
+    except Exception as e:
+        return _worker.failed_result(url, depth, e)
+
+
+class Reprocessor:
+    """Re-runs link extraction and classification over a stored job's scraped pages, without network access."""
+
+    def __init__(self, job_path: str, logger: logging.Logger, n_jobs: int = -1):
+        self.job_path = Path(job_path)
+        self.logger = logger
+        self.n_jobs = cpu_count() if n_jobs == -1 else n_jobs
+        self.link_graph = LinkGraphBuilder()
+
+    def _resolve_root_url(self, entries: List[Dict]) -> str:
+        """Root URL recorded by the crawl, or the job directory's domain."""
+        for entry in entries:
+            if entry['root_url']:
+                return entry['root_url']
+        return f"https://{self.job_path.name}"
+
+    def _reprocess_entries(self, entries: List[Dict]) -> Iterator[CrawlPageResult]:
+        """Yield reprocessed page results in index order, skipping unreadable pages and pages whose URL is unknown."""
+        self.logger.info(f"Reprocessing {len(entries):,d} stored pages from {self.job_path} with {self.n_jobs} processes")
+        chunksize = max(1, len(entries) // (self.n_jobs * 4))
+        with ProcessPoolExecutor(max_workers=self.n_jobs, initializer=_init_process) as executor:
+            for entry, result in zip(entries, executor.map(_reprocess_page, entries, chunksize=chunksize)):
+                if isinstance(result, str):
+                    self.logger.warning(f"Skipped {entry['path']}: {result}")
+                    continue
+                yield result
+
+    def run(self) -> CrawlProcessResult:
+        """Reprocess all stored pages into a crawl process result."""
+        entries = load_scrape_index(self.job_path)
+        if not entries:
+            raise FileNotFoundError(f"No scraped pages found under {self.job_path / Config.get_scrape_dir()}")
+
+        process_result = CrawlProcessResult(root_url=self._resolve_root_url(entries))
+        for result in self._reprocess_entries(entries):
+            process_result.crawled_pages[result.url] = result
+            self.link_graph.add_page(result.url, result.links)
+            process_result.all_urls.update(result.links)
+            process_result.max_depth_reached = max(process_result.max_depth_reached, result.depth)
+
+        process_result.end_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.logger.info(process_result.format_completion())
+        return process_result
@@ -1,79 +1,115 @@
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 from datetime import datetime
 import hashlib
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright, Page, Playwright, Route
+from urllib.parse import urlparse
 
 from ...utils.file_io import save_scrape_content
 from ...utils.config import Config
 from ...utils.metrics_pubsub import MetricsPubSub
 from ...app.models.metrics import MetricType
+from ...app.models.scrape_profile import ScrapeProfile
+
+# Single round-trip extraction of page content, title and resolved links.
+# Content is serialized like page.content(): doctype plus the document element.
+EXTRACT_PAGE_SCRIPT = """() => ({
+    content: (document.doctype ? new XMLSerializer().serializeToString(document.doctype) : '')
+        + (document.documentElement ? document.documentElement.outerHTML : ''),
+    title: document.title,
+    links: Array.from(document.querySelectorAll('a[href]'), a => a.href)
+})"""
 
 class Scraper:
     """Core scraper component that handles web page content extraction and storage."""
     
-    def __init__(self, logger: logging.Logger, metrics: MetricsPubSub, root_url: str):
-        """Initialize scraper with logger and root URL."""
+    def __init__(self, logger: logging.Logger, metrics: MetricsPubSub, root_url: str, profile: Optional[ScrapeProfile] = None):
+        """Initialize scraper with logger, root URL and scrape profile."""
         self.logger = logger
         self.root_url = root_url
         self.save_dir = Path(Config.get_scrape_dir())
         self.save_dir.mkdir(parents=True, exist_ok=True)
         self.metrics = metrics
+        self.profile = profile or ScrapeProfile.from_config()
         
-    async def _setup_browser(self) -> Tuple[Page, Any]:
+    async def _setup_browser(self, playwright: Playwright, url: str) -> Tuple[Page, Any]:
         """Setup and configure browser for scraping."""
-        playwright = await async_playwright().start()
         browser = await playwright.chromium.launch(
             headless=Config.get_headless_mode()
         )
-        page = await browser.new_page()
+        page = await browser.new_page(java_script_enabled=self.profile.js_enabled)
         
         # Configure page
         await page.set_extra_http_headers({
             'User-Agent': Config.get_user_agent()
         })
         
+        if self.profile.intercepts_requests:
+            page_host = urlparse(url).hostname or ''
+            await page.route('**/*', lambda route: self._intercept_request(route, page_host))
+        
         return page, browser
         
+    async def _intercept_request(self, route: Route, page_host: str) -> None:
+        """Abort requests blocked by the scrape profile, continue the rest."""
+        request = route.request
+        # Never block the document navigation itself
+        if request.is_navigation_request() and request.frame == request.frame.page.main_frame:
+            await route.continue_()
+        elif self.profile.should_block(request.resource_type, urlparse(request.url).hostname or '', page_host):
+            await route.abort()
+        else:
+            await route.continue_()
+        
     async def _navigate_to_page(self, page: Page, url: str) -> None:
-        """Navigate to URL and wait for page load."""
+        """Navigate to URL and wait for the configured load condition."""
+        timeout = Config.get_timeout() * 1000
         await page.goto(
             url,
-            wait_until='networkidle',
-            timeout=Config.get_timeout() * 1000
+            wait_until=self.profile.wait_until,
+            timeout=timeout
         )
+        if self.profile.wait_selector:
+            await page.wait_for_selector(self.profile.wait_selector, timeout=timeout)
         
-    async def _extract_content(self, page: Page) -> Tuple[str, str]:
-        """Extract content and title from page."""
-        content = await page.content()
-        title = await page.title()
-        return content, title
+    async def _extract_content(self, page: Page) -> Tuple[str, str, List[str]]:
+        """Extract content, title and links from page in a single evaluation."""
+        extracted = await page.evaluate(EXTRACT_PAGE_SCRIPT)
+        return extracted['content'], extracted['title'], extracted['links']
         
-    async def _save_content(self, url: str, content: str) -> Path:
-        return save_scrape_content(self.root_url,url, content)
+    async def _save_content(self, url: str, content: str, depth: Optional[int] = None) -> Path:
+        return save_scrape_content(self.root_url, url, content, depth)
         
-    def _create_result(self, url: str, title: str, saved_path: Path) -> Dict[str, Any]:
+    def _create_result(self, url: str, title: str, links: List[str], saved_path: Path) -> Dict[str, Any]:
         """Create successful scrape result."""
         return {
             'url': url,
             'title': title,
+            'links': links,
             'saved_path': str(saved_path),
             'timestamp': datetime.now().isoformat()
         }
         
-    async def scrape(self, url: str) -> Optional[Dict[str, Any]]:
+    async def scrape(self, url: str, depth: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """Scrape a single URL and save its content."""
         page = None
         browser = None
         
         try:
             self.metrics.publish(MetricType.SCRAPE_STARTED, url)
-            page, browser = await self._setup_browser()
-            await self._navigate_to_page(page, url)
-            content, title = await self._extract_content(page)
-            saved_path = await self._save_content(url, content)
-            result = self._create_result(url, title, saved_path)
+            async with async_playwright() as playwright:
+                try:
+                    page, browser = await self._setup_browser(playwright, url)
+                    await self._navigate_to_page(page, url)
+                    content, title, links = await self._extract_content(page)
+                    saved_path = await self._save_content(url, content, depth)
+                    result = self._create_result(url, title, links, saved_path)
+                finally:
+                    if page:
+                        await page.close()
+                    if browser:
+                        await browser.close()
             
             self.metrics.publish(MetricType.SCRAPE_COMPLETED, url)
             return result
@@ -82,9 +118,3 @@ class Scraper:
             self.logger.error(f"Error scraping {url}: {str(e)}")
             self.metrics.publish(MetricType.SCRAPE_FAILED, url)
             return None
-            
-        finally:
-            if page:
-                await page.close()
-            if browser:
-                await browser.close()
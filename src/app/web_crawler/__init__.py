@@ -1,5 +1,7 @@
+from .crawl_frontier import CrawlFrontier
 from .web_crawler_manager import WebCrawlerManager
 
 __all__ = [
+    'CrawlFrontier',
     'WebCrawlerManager',
 ]
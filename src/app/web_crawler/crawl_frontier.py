@@ -0,0 +1,95 @@
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from multiprocessing import cpu_count
+
+from ..models import CrawlProcessResult, CrawlPageResult, MetricType
+from ..link_graph import LinkGraphBuilder
+from ...utils import Config
+from ...utils.metrics_pubsub import MetricsPubSub
+from .crawler_trap_detector import CrawlerTrapDetector
+from .crawl_scope import CrawlScope
+
+
+class CrawlFrontier(ABC):
+    """Frontier admission and result bookkeeping shared by local and distributed crawls.
+
+    Owns the visited set, scope rules, trap detection, link graph and process result.
+    Subclasses decide where admitted URLs go.
+    """
+
+    def __init__(self, root_url: str, max_depth: int, logger: logging.Logger, metrics: MetricsPubSub, n_jobs: int = -1):
+        # Thread-safe tracking of visited URLs
+        self.visited_urls = set()
+        self.visited_lock = threading.Lock()
+        self.logger = logger
+        self.max_depth = max_depth
+        self.n_jobs = n_jobs
+        self.metrics = metrics
+        self.process_result = CrawlProcessResult(root_url=root_url)
+        self.root_url = root_url
+        self.scope = CrawlScope(root_url)
+        self.trap_detector = CrawlerTrapDetector()
+        # External hop counts of queued off-site URLs, dropped once their links are queued
+        self.external_hops: Dict[str, int] = {}
+        self.link_graph = LinkGraphBuilder()
+
+    @abstractmethod
+    def _submit(self, url: str, depth: int) -> None:
+        """Hand an admitted URL to the frontier."""
+
+    @abstractmethod
+    def _queue_size(self) -> int:
+        """Number of URLs waiting in the frontier."""
+
+    def _prefetch_host(self, url: str) -> None:
+        """Hook called for each admitted URL, e.g. to warm a DNS cache."""
+
+    def _seed(self) -> None:
+        """Queue the root URL."""
+        with self.visited_lock:
+            self.visited_urls.add(self.root_url)
+            self._submit(self.root_url, 1)
+            self.metrics.publish(MetricType.URL_QUEUED, self.root_url)
+
+    def _on_page_parsed(self, result: CrawlPageResult) -> None:
+        """Enqueue stage: queue a page's links as soon as they are parsed."""
+        self.process_result.all_urls.update(result.links)
+        parent_hops = self.external_hops.pop(result.url, 0)
+        if result.depth < self.max_depth:
+            self._queue_new_urls(result.links, result.depth + 1, parent_hops)
+
+    def _record_result(self, result: CrawlPageResult) -> None:
+        """Record a final page result in the process result and link graph."""
+        self.process_result.crawled_pages[result.url] = result
+        self.link_graph.add_page(result.url, result.links)
+        self.process_result.max_depth_reached = max(self.process_result.max_depth_reached, result.depth)
+        if len(self.process_result.crawled_pages) % self._calc_batch_size() == 0:
+            self.logger.info(self.process_result.format_progress(self._queue_size()))
+
+    def _queue_new_urls(self, new_urls: List[str], depth: int, parent_hops: int = 0) -> None:
+        """Queue new in-scope, unvisited URLs for crawling, suppressing likely crawler traps. Thread-safe."""
+        for new_url in new_urls:
+            hops = self.scope.external_hops(new_url, parent_hops)
+            if not self.scope.in_scope(new_url, hops):
+                continue
+            with self.visited_lock:
+                if new_url in self.visited_urls:
+                    continue
+                self.visited_urls.add(new_url)
+                trap_reason = self.trap_detector.check(new_url)
+                if trap_reason:
+                    self.logger.debug(f"Suppressed {new_url}: {trap_reason}")
+                    self.metrics.publish(MetricType.URL_SUPPRESSED, new_url)
+                    continue
+                if hops:
+                    self.external_hops[new_url] = hops
+                self._submit(new_url, depth)
+                self._prefetch_host(new_url)
+                self.metrics.publish(MetricType.URL_QUEUED, new_url)
+
+    def _calc_batch_size(self) -> int:
+        """Calculate the optimal batch size for async operations."""
+        n_workers = cpu_count() if self.n_jobs == -1 else self.n_jobs
+        return max(Config.get_max_batch_size(), n_workers * 8)
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+from ..models import CrawlPageResult, MetricType
+from ..scraper import Scraper
+from ..fetcher import Fetcher
+from .web_crawler_worker import WebCrawlerWorker
+
+
+class CrawlPipeline:
+    """Overlapped per-page processing: fetch -> parse -> enqueue links -> render -> store.
+
+    Stages are connected by bounded asyncio queues, so a slow stage applies
+    backpressure to the ones before it while link discovery keeps running
+    ahead of browser rendering.
+    """
+
+    def __init__(
+        self,
+        worker: WebCrawlerWorker,
+        scraper: Optional[Scraper],
+        logger: logging.Logger,
+        on_parsed: Callable[[CrawlPageResult], None],
+        on_stored: Callable[[CrawlPageResult], Awaitable[None]],
+        fetch_concurrency: int,
+        render_concurrency: int,
+        queue_size: int
+    ):
+        self.worker = worker
+        self.scraper = scraper
+        self.logger = logger
+        self.on_parsed = on_parsed
+        self.on_stored = on_stored
+        self.fetch_concurrency = fetch_concurrency
+        self.render_concurrency = render_concurrency
+
+        # Frontier is unbounded: the parse stage feeds it and must never block on it
+        self.frontier: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.parse_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.render_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.store_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        # URLs submitted but not yet stored; the crawl ends when this drops to zero
+        self._pending = 0
+        self._drained = asyncio.Event()
+        # Cleared while paused; fetch workers wait on it before taking and before fetching a URL
+        self._running = asyncio.Event()
+        self._running.set()
+
+    def submit(self, url: str, depth: int) -> None:
+        """Add a URL to the frontier."""
+        self._pending += 1
+        self._drained.clear()
+        self.frontier.put_nowait((depth, url))
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def pause(self) -> None:
+        """Stop starting new fetches. Pages already in flight run to completion."""
+        self._running.clear()
+
+    def resume(self) -> None:
+        self._running.set()
+
+    async def run(self, fetcher: Fetcher) -> None:
+        """Run all stages until every submitted URL has been stored."""
+        if self._pending == 0:
+            return
+
+        tasks: List[asyncio.Task] = []
+        tasks += [asyncio.create_task(self._fetch_stage(fetcher)) for _ in range(self.fetch_concurrency)]
+        tasks += [asyncio.create_task(self._parse_stage()) for _ in range(self.fetch_concurrency)]
+        tasks += [asyncio.create_task(self._render_stage()) for _ in range(self.render_concurrency)]
+        tasks.append(asyncio.create_task(self._store_stage()))
+
+        try:
+            await self._drained.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_stage(self, fetcher: Fetcher) -> None:
+        while True:
+            await self._running.wait()
+            depth, url = await self.frontier.get()
+            # Workers already waiting on the frontier when the crawl was paused hold their URL until resume
+            await self._running.wait()
+            try:
+                content = await self.worker.fetch(fetcher, url)
+                await self.parse_queue.put((url, depth, content))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await self.store_queue.put(self.worker.failed_result(url, depth, e))
+
+    async def _parse_stage(self) -> None:
+        while True:
+            url, depth, content = await self.parse_queue.get()
+            try:
+                # BeautifulSoup parsing is CPU-bound; keep it off the event loop
+                result = await asyncio.to_thread(self.worker.parse, url, depth, content)
+                self.on_parsed(result)
+                self.worker.metrics.publish(MetricType.URL_PROCESSED, url)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await self.store_queue.put(self.worker.failed_result(url, depth, e))
+                continue
+            await self.render_queue.put(result)
+
+    async def _render_stage(self) -> None:
+        while True:
+            result = await self.render_queue.get()
+            try:
+                # Scraper reports its own failures; the crawl result stands either way
+                if self.scraper:
+                    await self.scraper.scrape(result.url, result.depth)
+                self.logger.debug(f"Successfully crawled and scraped {result.url} (depth: {result.depth})")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error rendering {result.url}: {str(e)}")
+            await self.store_queue.put(result)
+
+    async def _store_stage(self) -> None:
+        while True:
+            result = await self.store_queue.get()
+            try:
+                await self.on_stored(result)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error storing result for {result.url}: {str(e)}")
+            finally:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._drained.set()
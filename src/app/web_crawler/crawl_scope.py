@@ -0,0 +1,150 @@
+import re
+from typing import Dict, List, Pattern, Tuple
+from urllib.parse import urlparse
+
+from ...utils import Config
+
+URL_PREFIX_PATTERN = r'^[a-z][a-z0-9+.-]*://[^/?#]*'
+CRAWLABLE_SCHEMES = ('http', 'https')
+# Inline global flags such as (?i) are only valid at the very start of a pattern
+INLINE_GLOBAL_FLAGS = re.compile(r'^\(\?([aiLmsux]+)\)')
+# Backreferences, named-group references and conditionals depend on group numbering
+GROUP_REFERENCE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+
+class HostSuffixTrie:
+    """Trie over reversed host labels.
+
+    'example.com' matches only that host; '*.example.com' matches example.com and all its subdomains.
+    """
+
+    def __init__(self):
+        self.root: Dict = {}
+
+    def add(self, pattern: str) -> None:
+        pattern = pattern.strip().lower()
+        wildcard = pattern.startswith('*.')
+        labels = pattern[2:].split('.') if wildcard else pattern.split('.')
+        node = self.root
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+        node['*' if wildcard else '$'] = True
+
+    def match(self, host: str) -> bool:
+        node = self.root
+        for label in reversed(host.lower().split('.')):
+            if '*' in node:
+                return True
+            node = node.get(label)
+            if node is None:
+                return False
+        return '*' in node or '$' in node
+
+    def __bool__(self) -> bool:
+        return bool(self.root)
+
+
+class CrawlScope:
+    """Declarative crawl scope compiled into a host suffix trie per domain list plus one include and one exclude regex."""
+
+    def __init__(
+        self,
+        root_url: str,
+        allowed_domains: List[str] = None,
+        denied_domains: List[str] = None,
+        include_paths: List[str] = None,
+        exclude_paths: List[str] = None,
+        include_patterns: List[str] = None,
+        exclude_patterns: List[str] = None,
+        blocked_extensions: List[str] = None,
+        max_external_hops: int = None
+    ):
+        root_host = urlparse(root_url).hostname or ''
+        # example.com and www.example.com are the same site
+        self.root_hosts = {root_host, root_host[4:] if root_host.startswith('www.') else f'www.{root_host}'}
+        self.allowed_domains = self._compile_domains(Config.get_scope_allowed_domains() if allowed_domains is None else allowed_domains)
+        self.denied_domains = self._compile_domains(Config.get_scope_denied_domains() if denied_domains is None else denied_domains)
+        self.include_regexes = self._compile_regexes(
+            Config.get_scope_include_paths() if include_paths is None else include_paths,
+            Config.get_scope_include_patterns() if include_patterns is None else include_patterns
+        )
+        self.exclude_regexes = self._compile_regexes(
+            Config.get_scope_exclude_paths() if exclude_paths is None else exclude_paths,
+            Config.get_scope_exclude_patterns() if exclude_patterns is None else exclude_patterns,
+            Config.get_scope_blocked_extensions() if blocked_extensions is None else blocked_extensions
+        )
+        self.max_external_hops = Config.get_scope_max_external_hops() if max_external_hops is None else max_external_hops
+
+    @staticmethod
+    def _compile_domains(patterns: List[str]) -> HostSuffixTrie:
+        trie = HostSuffixTrie()
+        for pattern in patterns:
+            if pattern.strip():
+                trie.add(pattern)
+        return trie
+
+    @staticmethod
+    def _prepare_pattern(pattern: str) -> Tuple[str, bool]:
+        """Validate one user regex. Returns it in combinable form and whether it can share the combined alternation."""
+        try:
+            compiled = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"Invalid crawl scope pattern '{pattern}': {e}") from e
+        combinable = not (compiled.groupindex or GROUP_REFERENCE.search(pattern))
+        # Rewrite leading global flags into a scoped group, which is valid mid-pattern
+        match = INLINE_GLOBAL_FLAGS.match(pattern)
+        if match:
+            flags = match.group(1)
+            # A verbose-mode comment at the end must not swallow the closing parenthesis
+            closing = '\n)' if 'x' in flags else ')'
+            pattern = f'(?{flags}:{pattern[match.end():]}{closing}'
+        return pattern, combinable
+
+    @classmethod
+    def _compile_regexes(cls, path_prefixes: List[str], patterns: List[str], extensions: List[str] = None) -> List[Pattern]:
+        """Combine path prefixes, URL regexes and file extensions into a single alternation.
+
+        Regexes that rely on group numbering or names are compiled on their own.
+        """
+        alternatives = [URL_PREFIX_PATTERN + re.escape(prefix) for prefix in path_prefixes if prefix]
+        standalone = []
+        for pattern in patterns:
+            if not pattern:
+                continue
+            pattern, combinable = cls._prepare_pattern(pattern)
+            if combinable:
+                alternatives.append(f'(?:{pattern})')
+            else:
+                standalone.append(re.compile(pattern, re.IGNORECASE))
+        extensions = [extension.strip().lstrip('.') for extension in extensions or [] if extension.strip()]
+        if extensions:
+            alternatives.append(r'\.(?:' + '|'.join(re.escape(extension) for extension in extensions) + r')(?:[?#]|$)')
+        combined = [re.compile('|'.join(alternatives), re.IGNORECASE)] if alternatives else []
+        return combined + standalone
+
+    def is_internal(self, url: str) -> bool:
+        """Whether a URL is on the root host, its www. variant or an explicitly allowed domain."""
+        host = urlparse(url).hostname or ''
+        return host in self.root_hosts or self.allowed_domains.match(host)
+
+    def external_hops(self, url: str, parent_hops: int) -> int:
+        """Number of consecutive external pages leading to this URL."""
+        return 0 if self.is_internal(url) else parent_hops + 1
+
+    def in_scope(self, url: str, hops: int = 0) -> bool:
+        """Check a URL against all scope rules."""
+        parsed = urlparse(url)
+        if parsed.scheme not in CRAWLABLE_SCHEMES:
+            return False
+        host = parsed.hostname or ''
+        if self.denied_domains and self.denied_domains.match(host):
+            return False
+        if self.allowed_domains and host not in self.root_hosts and not self.allowed_domains.match(host):
+            return False
+        if self.max_external_hops >= 0 and hops > self.max_external_hops:
+            return False
+        if any(regex.search(url) for regex in self.exclude_regexes):
+            return False
+        if self.include_regexes and not any(regex.search(url) for regex in self.include_regexes):
+            return False
+        return True
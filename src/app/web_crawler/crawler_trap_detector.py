@@ -0,0 +1,82 @@
+import re
+from collections import Counter
+from typing import Optional
+from urllib.parse import urlparse, parse_qsl
+
+from ...utils import Config
+
+# Path segments that look like IDs, dates or hashes collapse into one template slot
+ID_SEGMENT_PATTERN = re.compile(r'^(\d+|[0-9a-f]{8,}|[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}|.*\d{4,}.*)$', re.IGNORECASE)
+SESSION_ID_PATTERN = re.compile(r'[;/](jsessionid|phpsessid|sid|sessionid|session_id)=', re.IGNORECASE)
+
+
+class CrawlerTrapDetector:
+    """Detects crawler traps and infinite URL spaces before URLs reach the frontier.
+
+    Limits of 0 disable the corresponding check.
+    """
+
+    def __init__(
+        self,
+        max_path_depth: int = None,
+        max_segment_repeats: int = None,
+        max_urls_per_pattern: int = None,
+        max_query_params: int = None,
+        max_query_variants: int = None,
+        max_pages_per_host: int = None
+    ):
+        self.max_path_depth = Config.get_trap_max_path_depth() if max_path_depth is None else max_path_depth
+        self.max_segment_repeats = Config.get_trap_max_segment_repeats() if max_segment_repeats is None else max_segment_repeats
+        self.max_urls_per_pattern = Config.get_trap_max_urls_per_pattern() if max_urls_per_pattern is None else max_urls_per_pattern
+        self.max_query_params = Config.get_trap_max_query_params() if max_query_params is None else max_query_params
+        self.max_query_variants = Config.get_trap_max_query_variants() if max_query_variants is None else max_query_variants
+        self.max_pages_per_host = Config.get_trap_max_pages_per_host() if max_pages_per_host is None else max_pages_per_host
+
+        self.pattern_counts = Counter()
+        self.query_variant_counts = Counter()
+        self.host_counts = Counter()
+
+    @staticmethod
+    def _template_segment(segment: str) -> str:
+        return '{id}' if ID_SEGMENT_PATTERN.match(segment) else segment
+
+    def check(self, url: str) -> Optional[str]:
+        """Check a new URL. Returns the reason it is a likely trap, or None to admit it.
+
+        Admitted URLs are counted against the per-host and per-pattern budgets.
+        """
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        segments = [segment for segment in parsed.path.split('/') if segment]
+
+        # urlparse moves ';...' of the last path segment into params, e.g. /shop;jsessionid=ABC
+        if SESSION_ID_PATTERN.search(f'{parsed.path};{parsed.params}'):
+            return "session id in path"
+        if self.max_path_depth and len(segments) > self.max_path_depth:
+            return f"path depth {len(segments)} exceeds {self.max_path_depth}"
+        if self.max_segment_repeats and segments:
+            segment, repeats = Counter(segments).most_common(1)[0]
+            if repeats > self.max_segment_repeats:
+                return f"path segment '{segment}' repeated {repeats} times"
+
+        params = parse_qsl(parsed.query, keep_blank_values=True)
+        if self.max_query_params and len(params) > self.max_query_params:
+            return f"{len(params)} query parameters exceed {self.max_query_params}"
+
+        template = '/'.join(self._template_segment(segment) for segment in segments)
+        param_names = ','.join(sorted({name for name, _ in params}))
+        pattern_key = (host, template, param_names)
+        variant_key = (host, parsed.path)
+
+        if self.max_pages_per_host and self.host_counts[host] >= self.max_pages_per_host:
+            return f"host page budget of {self.max_pages_per_host} exhausted"
+        if self.max_urls_per_pattern and self.pattern_counts[pattern_key] >= self.max_urls_per_pattern:
+            return f"URL pattern /{template}?{param_names} exceeds {self.max_urls_per_pattern} URLs"
+        if params and self.max_query_variants and self.query_variant_counts[variant_key] >= self.max_query_variants:
+            return f"query variants of {parsed.path or '/'} exceed {self.max_query_variants}"
+
+        self.host_counts[host] += 1
+        self.pattern_counts[pattern_key] += 1
+        if params:
+            self.query_variant_counts[variant_key] += 1
+        return None
@@ -1,35 +1,38 @@
 import asyncio
 import logging
-import threading
 import datetime
-from queue import PriorityQueue
-from typing import Dict, List, Tuple
-from multiprocessing import cpu_count
+import time
+from typing import AsyncIterator, Optional
+import aiohttp
+from urllib.parse import urlparse
 from ...utils.metrics_pubsub import MetricsPubSub
 
-from ..models import CrawlProcessResult, CrawlPageResult, MetricType
-from ...utils import Config
+from ..models import CrawlProcessResult, CrawlPageResult
+from ...utils import Config, CachingResolver
+from .crawl_frontier import CrawlFrontier
 from .web_crawler_worker import WebCrawlerWorker
+from .crawl_pipeline import CrawlPipeline
 from ..scraper import Scraper
+from ..fetcher import AiohttpFetcher, Fetcher, create_fetcher
 
 
-class WebCrawlerManager:
+class WebCrawlerManager(CrawlFrontier):
     """Manager class for coordinating web crawling operations."""
     
-    def __init__(self, root_url: str, max_depth: int, logger: logging.Logger, metrics: MetricsPubSub, n_jobs: int = -1):
-        # Thread-safe tracking of visited URLs
-        self.visited_urls = set()
-        self.visited_lock = threading.Lock()
-        self.logger = logger
-        self.max_depth = max_depth
-        self.n_jobs = n_jobs
-        self.metrics = metrics
-        self.process_result = CrawlProcessResult(root_url=root_url)
-        self.root_url = root_url
-        self.scraper = Scraper(logger, metrics, root_url)
-        
-        # Thread-safe queue for URL processing
-        self.url_queue = PriorityQueue()
+    def __init__(self, root_url: str, max_depth: int, logger: logging.Logger, metrics: MetricsPubSub, n_jobs: int = -1,
+                 fetch_backend: Optional[str] = None, scrape: bool = True):
+        super().__init__(root_url, max_depth, logger, metrics, n_jobs)
+        self.scraper = Scraper(logger, metrics, root_url) if scrape else None
+        self.fetch_backend = fetch_backend or Config.get_fetch_backend()
+        self.pipeline = None
+        self._results = None
+        self._crawl_task = None
+        # Control state set by pause()/cancel(), also before the stream has started
+        self._paused = False
+        self._cancelled = False
+        self.resolver = CachingResolver()
+        self.prefetch_dns = True
+        self._started: Optional[float] = None
         
         # Init web session configuration
         self.headers = {'User-Agent': Config.get_user_agent()}
@@ -40,34 +43,104 @@ class WebCrawlerManager:
         return asyncio.run(self._crawl_async())
         
     async def _crawl_async(self) -> CrawlProcessResult:
+        async for _ in self.stream():
+            pass
+        return self.process_result
+
+    async def stream(self, session: Optional[aiohttp.ClientSession] = None, fetcher: Optional[Fetcher] = None) -> AsyncIterator[CrawlPageResult]:
+        """Crawl on the caller's event loop, yielding page results as they complete.
+
+        The crawl slows down when the consumer lags behind. An optional caller-owned
+        aiohttp session or fetcher is reused for all fetches and left open. Use
+        pause(), resume() and cancel() to control the crawl, also before iterating.
+        """
+        if self._cancelled:
+            return
         self.logger.info(f"Starting crawl from {self.root_url} with max depth {self.max_depth}")
+        self._started = time.monotonic()
         
-        current_depth = 1
-        with self.visited_lock:
-            self.visited_urls.add(self.root_url)
-            self.url_queue.put((current_depth, self.root_url))
-            self.metrics.publish(MetricType.URL_QUEUED, self.root_url)
-            
-        batch_size = self._calc_batch_size()
-        
-        while not self.url_queue.empty() and current_depth <= self.max_depth:
-            urls_with_depth = self._prepare_batch(batch_size)
-            if not urls_with_depth:
-                continue
-            
-            page_results = await self._process_batch(urls_with_depth)
-            current_depth += 1
-            self._update_process_result(page_results, current_depth)
-            
-            
-            self.logger.info(self.process_result.format_progress(self.url_queue.qsize()))
-            
-        # Set end completion stats
-        self.process_result.max_depth_reached = current_depth - 1
-        self.process_result.end_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self.logger.info(self.process_result.format_completion())
+        self._results = asyncio.Queue(maxsize=Config.get_stage_queue_size())
+        self.pipeline = self._create_pipeline()
+        if self._paused:
+            self.pipeline.pause()
+        self._seed()
         
-        return self.process_result
+        if fetcher is None and session is not None:
+            fetcher = AiohttpFetcher(self.headers, self.timeout, session=session)
+        self._crawl_task = asyncio.create_task(self._run_pipeline(fetcher))
+        try:
+            while not (self._results.empty() and self._crawl_task.done()):
+                # Results still queued when the crawl is cancelled are dropped
+                if (result := await self._results.get()) is None or self._cancelled:
+                    break
+                yield result
+            # A cancelled crawl simply ends the stream; other failures propagate
+            await asyncio.wait({self._crawl_task})
+            if not self._crawl_task.cancelled():
+                self._crawl_task.result()
+        finally:
+            if not self._crawl_task.done():
+                self._crawl_task.cancel()
+                await asyncio.gather(self._crawl_task, return_exceptions=True)
+
+    async def _run_pipeline(self, fetcher: Optional[Fetcher]) -> None:
+        owns_fetcher = fetcher is None
+        try:
+            if owns_fetcher:
+                fetcher = create_fetcher(self.fetch_backend, self.headers, self.timeout, self.resolver)
+            # Prefetching only helps fetchers that look hosts up through this crawl's resolver
+            self.prefetch_dns = fetcher.resolver is self.resolver
+            await self.pipeline.run(fetcher)
+        finally:
+            if owns_fetcher and fetcher is not None:
+                await fetcher.close()
+            await self.resolver.close()
+            # Set end completion stats
+            self.process_result.end_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self.logger.info(self.process_result.format_completion())
+            # Never block here: after aclose() nothing reads the queue any more. When it is
+            # full, the consumer ends the stream once it drains the queue of the finished crawl.
+            try:
+                self._results.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+
+    def pause(self) -> None:
+        """Pause the crawl; pages already in flight still complete."""
+        self._paused = True
+        if self.pipeline:
+            self.pipeline.pause()
+
+    def resume(self) -> None:
+        """Resume a paused crawl."""
+        self._paused = False
+        if self.pipeline:
+            self.pipeline.resume()
+
+    def cancel(self) -> None:
+        """Cancel the crawl. The stream yields no further results."""
+        self._cancelled = True
+        if self._crawl_task and not self._crawl_task.done():
+            self._crawl_task.cancel()
+
+    def _submit(self, url: str, depth: int) -> None:
+        self.pipeline.submit(url, depth)
+
+    def _prefetch_host(self, url: str) -> None:
+        """Warm the DNS cache for a queued URL's host before its fetch comes up."""
+        if self.prefetch_dns and not self._beyond_dns_ttl():
+            self.resolver.prefetch(urlparse(url).hostname)
+
+    def _beyond_dns_ttl(self) -> bool:
+        """Whether a URL queued now will likely be fetched only after a prefetched lookup expires."""
+        crawled = len(self.process_result.crawled_pages)
+        if not crawled or self._started is None:
+            return False
+        seconds_per_page = (time.monotonic() - self._started) / crawled
+        return self._queue_size() * seconds_per_page > self.resolver.ttl
+
+    def _queue_size(self) -> int:
+        return self.pipeline.frontier.qsize()
 
     def _create_worker(self) -> WebCrawlerWorker:
         """Create a new worker instance."""
@@ -79,41 +152,21 @@ class WebCrawlerManager:
             metrics=self.metrics
         )
 
-    def _prepare_batch(self, batch_size: int) -> List[Tuple[str, int]]:
-        """Prepare a batch of URLs with their depths for processing.
-        Returns a list of (url, depth) tuples in priority order."""
-        urls_with_depth = []
-        
-        while len(urls_with_depth) < batch_size and not self.url_queue.empty():
-            depth, url = self.url_queue.get()
-            urls_with_depth.append((url, depth))
-        
-        return urls_with_depth
-
-    async def _process_batch(self, urls_with_depth: List[Tuple[str, int]]) -> List[CrawlPageResult]:
-        """Process a batch of URLs in parallel using asyncio."""
-        worker = self._create_worker()
-        tasks = [asyncio.create_task(worker.crawl_url(url, depth)) for url, depth in urls_with_depth]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        return results
-
-    def _update_process_result(self, page_results: List[CrawlPageResult], depth: int) -> None:
-        """Update process results and queue new URLs for next depth."""
-        for result in page_results:
-            self.process_result.crawled_pages[result.url] = result
-            if result.success:
-                self.process_result.all_urls.update(set(result.links))
-                self._queue_new_urls(result.links, depth)
-
-    def _queue_new_urls(self, new_urls: List[str], depth: int) -> None:
-        """Queue new unvisited URLs for crawling. Thread-safe."""
-        for new_url in new_urls:
-            with self.visited_lock:
-                if new_url not in self.visited_urls:
-                    self.visited_urls.add(new_url)
-                    self.url_queue.put((depth, new_url))
-
-    def _calc_batch_size(self) -> int:
-        """Calculate the optimal batch size for async operations."""
-        n_workers = cpu_count() if self.n_jobs == -1 else self.n_jobs
-        return max(Config.get_max_batch_size(), n_workers * 8)
+    def _create_pipeline(self) -> CrawlPipeline:
+        """Create the staged fetch/parse/render/store pipeline for this crawl."""
+        return CrawlPipeline(
+            worker=self._create_worker(),
+            scraper=self.scraper,
+            logger=self.logger,
+            on_parsed=self._on_page_parsed,
+            on_stored=self._on_page_stored,
+            fetch_concurrency=self._calc_batch_size(),
+            render_concurrency=Config.get_scrape_concurrency(),
+            queue_size=Config.get_stage_queue_size()
+        )
+
+    async def _on_page_stored(self, result: CrawlPageResult) -> None:
+        """Store stage: record the final page result and hand it to the stream consumer."""
+        self._record_result(result)
+        # Blocks while the stream consumer lags, backing up the pipeline stages
+        await self._results.put(result)
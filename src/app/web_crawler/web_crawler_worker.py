@@ -1,23 +1,28 @@
+import asyncio
 import logging
-import aiohttp
+from contextlib import nullcontext
 from bs4 import BeautifulSoup
-from typing import Dict, Set, Tuple
+from typing import Dict, Optional, Set, Tuple
 from urllib.parse import urlparse
 from datetime import datetime
 
 from ..models import CrawlPageResult
 from ..scraper import Scraper
-from ...utils import validate_url, make_full_url, is_same_domain, normalize_url
+from ..fetcher import Fetcher, create_fetcher
+from ...utils import Config, validate_url, make_full_url, is_same_domain, normalize_url, CachingResolver
 from ...utils.metrics_pubsub import MetricsPubSub
 from ...app.models.metrics import MetricType
 
 class WebCrawlerWorker:
     """Worker class for crawling individual URLs asynchronously."""
     
-    def __init__(self, headers: Dict[str, str], timeout: int, logger: logging.Logger, scraper: Scraper, metrics: MetricsPubSub = None):
+    def __init__(self, headers: Dict[str, str], timeout: int, logger: logging.Logger, scraper: Scraper, metrics: MetricsPubSub = None, resolver: CachingResolver = None,
+                 render_slots: Optional[asyncio.Semaphore] = None):
         self.headers = headers
+        self.resolver = resolver
+        # Bounds concurrent browser renders across crawl_url() calls
+        self.render_slots = render_slots
         self.raw_timeout = timeout
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.logger = logger
         self.scraper = scraper
         self.metrics = metrics
@@ -26,7 +31,7 @@ class WebCrawlerWorker:
         """Calculate the rank of a page based on its same domain links vs total links."""
         return same_domain_links_count / total_links_count if total_links_count > 0 else 0
     
-    async def _extract_links(self, html_content: str, base_url: str) -> Set[str]:
+    def _extract_links(self, html_content: str, base_url: str) -> Set[str]:
         """Extract and normalize links from HTML content."""
         soup = BeautifulSoup(html_content, 'html.parser')
         links = set()
@@ -51,44 +56,62 @@ class WebCrawlerWorker:
             
         return same_domain_links_count, external_links_count
 
-    async def crawl_url(self, url: str, depth: int) -> CrawlPageResult:
-        """Crawl a single URL and return the results."""
+    async def fetch(self, fetcher: Fetcher, url: str) -> str:
+        """Fetch stage: download the raw HTML of a page."""
+        self.metrics.publish(MetricType.URL_PROCESSING, url)
+        return await fetcher.fetch(url)
+
+    def parse(self, url: str, depth: int, content: str) -> CrawlPageResult:
+        """Parse stage: extract and classify links. CPU-bound, safe to run in a thread."""
+        links = self._extract_links(content, url)
+        same_domain_links_count, external_links_count = self._classify_links(links, url)
+        
+        return CrawlPageResult(
+            url=url,
+            depth=depth,
+            success=True,
+            error=None,
+            links=list(links),
+            same_domain_links_count=same_domain_links_count,
+            external_links_count=external_links_count,
+            ratio=same_domain_links_count / len(links) if links else 0,
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+    def failed_result(self, url: str, depth: int, error: Exception) -> CrawlPageResult:
+        """Build the result for a page that could not be crawled."""
+        self.logger.error(f"Error crawling {url} (depth: {depth}): {str(error)}")
+        self.metrics.publish(MetricType.URL_FAILED, url)
+        return CrawlPageResult(
+            url=url,
+            depth=depth,
+            success=False,
+            error=str(error),
+            links=[],
+            same_domain_links_count=0,
+            external_links_count=0,
+            ratio=0,
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+    async def crawl_url(self, url: str, depth: int, fetcher: Fetcher = None) -> CrawlPageResult:
+        """Crawl a single URL and return the results, running all stages in sequence.
+
+        Without a fetcher, a temporary one for the configured backend is used.
+        """
         try:
-            self.metrics.publish(MetricType.URL_PROCESSING, url)
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url, timeout=self.timeout) as response:
-                    response.raise_for_status()
-                    content = await response.text()
-                    await self.scraper.scrape(url)
-                    links = await self._extract_links(content, url)
-                    same_domain_links_count, external_links_count = self._classify_links(links, url)
-                    
-                    result = CrawlPageResult(
-                        url=url,
-                        depth=depth,
-                        success=True,
-                        error=None,
-                        links=list(links),
-                        same_domain_links_count=same_domain_links_count,
-                        external_links_count=external_links_count,
-                        ratio=same_domain_links_count / len(links) if links else 0,
-                        timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    )
-                    self.logger.debug(f"Successfully crawled and scraped {url} (depth: {depth})")
-                    self.metrics.publish(MetricType.URL_PROCESSED, url)
-                    return result
+            if fetcher is None:
+                async with create_fetcher(Config.get_fetch_backend(), self.headers, self.raw_timeout, self.resolver) as temporary_fetcher:
+                    content = await self.fetch(temporary_fetcher, url)
+            else:
+                content = await self.fetch(fetcher, url)
+            if self.scraper:
+                async with self.render_slots or nullcontext():
+                    await self.scraper.scrape(url, depth)
+            result = self.parse(url, depth, content)
+            self.logger.debug(f"Successfully crawled and scraped {url} (depth: {depth})")
+            self.metrics.publish(MetricType.URL_PROCESSED, url)
+            return result
                     
         except Exception as e:
-            self.logger.error(f"Error crawling {url} (depth: {depth}): {str(e)}")
-            self.metrics.publish(MetricType.URL_FAILED, url)
-            return CrawlPageResult(
-                url=url,
-                depth=depth,
-                success=False,
-                error=str(e),
-                links=[],
-                same_domain_links_count=0,
-                external_links_count=0,
-                ratio=0,
-                timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            )
+            return self.failed_result(url, depth, e)
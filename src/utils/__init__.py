@@ -3,6 +3,7 @@ from .logger import setup_logger
 from .url_utils import validate_url, normalize_url, make_full_url, get_domain, is_same_domain, normalize_and_validate_url
 from .interaction import with_progress_bar
 from .metrics_pubsub import MetricsPubSub
+from .dns_cache import CachingResolver
 
 __all__ = [
     'Config',
@@ -14,5 +15,6 @@ __all__ = [
     'is_same_domain',
     'with_progress_bar',
     'MetricsPubSub',
-    'normalize_and_validate_url'
+    'normalize_and_validate_url',
+    'CachingResolver'
 ]
@@ -1,6 +1,7 @@
 import os
 import logging
 from pathlib import Path
+from typing import List, Optional
 from environs import Env
 
 env = Env()
@@ -17,6 +18,47 @@ class Config:
     LOG_LEVEL = env.log_level('LOG_LEVEL', logging.INFO)
     MAX_BATCH_SIZE = env.int('MAX_BATCH_SIZE', 100)
     HEADLESS_MODE = env.bool('BROWSER_HEADLESS', True)
+    FETCH_BACKEND = env.str('FETCH_BACKEND', 'aiohttp')
+    STAGE_QUEUE_SIZE = env.int('STAGE_QUEUE_SIZE', 100)
+    SCRAPE_CONCURRENCY = env.int('SCRAPE_CONCURRENCY', 4)
+    
+    # DNS cache
+    DNS_CACHE_TTL = env.int('DNS_CACHE_TTL', 300)
+    DNS_NEGATIVE_TTL = env.int('DNS_NEGATIVE_TTL', 60)
+    DNS_CACHE_MAX_SIZE = env.int('DNS_CACHE_MAX_SIZE', 100000)
+    DNS_PREFETCH_CONCURRENCY = env.int('DNS_PREFETCH_CONCURRENCY', 4)
+    
+    # Distributed crawl
+    LEASE_BATCH_SIZE = env.int('LEASE_BATCH_SIZE', 20)
+    LEASE_TIMEOUT = env.int('LEASE_TIMEOUT', 120)
+    LEASE_POLL_INTERVAL = env.float('LEASE_POLL_INTERVAL', 1.0)
+    CRAWL_HOST_DELAY = env.float('CRAWL_HOST_DELAY', 0.0)
+    
+    # Crawl scope (domain patterns accept '*.example.com' wildcards; -1 hops means unlimited)
+    SCOPE_ALLOWED_DOMAINS = env.list('SCOPE_ALLOWED_DOMAINS', [])
+    SCOPE_DENIED_DOMAINS = env.list('SCOPE_DENIED_DOMAINS', [])
+    SCOPE_INCLUDE_PATHS = env.list('SCOPE_INCLUDE_PATHS', [])
+    SCOPE_EXCLUDE_PATHS = env.list('SCOPE_EXCLUDE_PATHS', [])
+    SCOPE_INCLUDE_PATTERNS = env.list('SCOPE_INCLUDE_PATTERNS', [], delimiter=' ')
+    SCOPE_EXCLUDE_PATTERNS = env.list('SCOPE_EXCLUDE_PATTERNS', [], delimiter=' ')
+    SCOPE_BLOCKED_EXTENSIONS = env.list('SCOPE_BLOCKED_EXTENSIONS', [])
+    SCOPE_MAX_EXTERNAL_HOPS = env.int('SCOPE_MAX_EXTERNAL_HOPS', -1)
+    
+    # Crawler trap detection (0 disables a limit)
+    TRAP_MAX_PATH_DEPTH = env.int('TRAP_MAX_PATH_DEPTH', 15)
+    TRAP_MAX_SEGMENT_REPEATS = env.int('TRAP_MAX_SEGMENT_REPEATS', 3)
+    TRAP_MAX_URLS_PER_PATTERN = env.int('TRAP_MAX_URLS_PER_PATTERN', 1000)
+    TRAP_MAX_QUERY_PARAMS = env.int('TRAP_MAX_QUERY_PARAMS', 10)
+    TRAP_MAX_QUERY_VARIANTS = env.int('TRAP_MAX_QUERY_VARIANTS', 200)
+    TRAP_MAX_PAGES_PER_HOST = env.int('TRAP_MAX_PAGES_PER_HOST', 10000)
+    
+    # Scrape profile
+    SCRAPE_WAIT_UNTIL = env.str('SCRAPE_WAIT_UNTIL', 'networkidle')
+    SCRAPE_WAIT_SELECTOR = env.str('SCRAPE_WAIT_SELECTOR', None)
+    SCRAPE_JS_ENABLED = env.bool('SCRAPE_JS_ENABLED', True)
+    SCRAPE_BLOCKED_RESOURCE_TYPES = env.list('SCRAPE_BLOCKED_RESOURCE_TYPES', [])
+    SCRAPE_BLOCKED_DOMAINS = env.list('SCRAPE_BLOCKED_DOMAINS', [])
+    SCRAPE_BLOCK_THIRD_PARTY = env.bool('SCRAPE_BLOCK_THIRD_PARTY', False)
     
     @classmethod
     def get_abs_path(cls, path: str) -> str:
@@ -53,3 +95,127 @@ class Config:
     @classmethod
     def get_headless_mode(cls) -> bool:
         return cls.HEADLESS_MODE
+    
+    @classmethod
+    def get_fetch_backend(cls) -> str:
+        return cls.FETCH_BACKEND
+    
+    @classmethod
+    def get_stage_queue_size(cls) -> int:
+        return cls.STAGE_QUEUE_SIZE
+    
+    @classmethod
+    def get_scrape_concurrency(cls) -> int:
+        return cls.SCRAPE_CONCURRENCY
+    
+    @classmethod
+    def get_scrape_wait_until(cls) -> str:
+        return cls.SCRAPE_WAIT_UNTIL
+    
+    @classmethod
+    def get_scrape_wait_selector(cls) -> Optional[str]:
+        return cls.SCRAPE_WAIT_SELECTOR
+    
+    @classmethod
+    def get_scrape_js_enabled(cls) -> bool:
+        return cls.SCRAPE_JS_ENABLED
+    
+    @classmethod
+    def get_scrape_blocked_resource_types(cls) -> List[str]:
+        return cls.SCRAPE_BLOCKED_RESOURCE_TYPES
+    
+    @classmethod
+    def get_scrape_blocked_domains(cls) -> List[str]:
+        return cls.SCRAPE_BLOCKED_DOMAINS
+    
+    @classmethod
+    def get_scrape_block_third_party(cls) -> bool:
+        return cls.SCRAPE_BLOCK_THIRD_PARTY
+    
+    @classmethod
+    def get_dns_cache_ttl(cls) -> int:
+        return cls.DNS_CACHE_TTL
+    
+    @classmethod
+    def get_dns_negative_ttl(cls) -> int:
+        return cls.DNS_NEGATIVE_TTL
+    
+    @classmethod
+    def get_dns_cache_max_size(cls) -> int:
+        return cls.DNS_CACHE_MAX_SIZE
+    
+    @classmethod
+    def get_dns_prefetch_concurrency(cls) -> int:
+        return cls.DNS_PREFETCH_CONCURRENCY
+    
+    @classmethod
+    def get_lease_batch_size(cls) -> int:
+        return cls.LEASE_BATCH_SIZE
+    
+    @classmethod
+    def get_lease_timeout(cls) -> int:
+        return cls.LEASE_TIMEOUT
+    
+    @classmethod
+    def get_lease_poll_interval(cls) -> float:
+        return cls.LEASE_POLL_INTERVAL
+    
+    @classmethod
+    def get_crawl_host_delay(cls) -> float:
+        return cls.CRAWL_HOST_DELAY
+    
+    @classmethod
+    def get_scope_allowed_domains(cls) -> List[str]:
+        return cls.SCOPE_ALLOWED_DOMAINS
+    
+    @classmethod
+    def get_scope_denied_domains(cls) -> List[str]:
+        return cls.SCOPE_DENIED_DOMAINS
+    
+    @classmethod
+    def get_scope_include_paths(cls) -> List[str]:
+        return cls.SCOPE_INCLUDE_PATHS
+    
+    @classmethod
+    def get_scope_exclude_paths(cls) -> List[str]:
+        return cls.SCOPE_EXCLUDE_PATHS
+    
+    @classmethod
+    def get_scope_include_patterns(cls) -> List[str]:
+        return cls.SCOPE_INCLUDE_PATTERNS
+    
+    @classmethod
+    def get_scope_exclude_patterns(cls) -> List[str]:
+        return cls.SCOPE_EXCLUDE_PATTERNS
+    
+    @classmethod
+    def get_scope_blocked_extensions(cls) -> List[str]:
+        return cls.SCOPE_BLOCKED_EXTENSIONS
+    
+    @classmethod
+    def get_scope_max_external_hops(cls) -> int:
+        return cls.SCOPE_MAX_EXTERNAL_HOPS
+    
+    @classmethod
+    def get_trap_max_path_depth(cls) -> int:
+        return cls.TRAP_MAX_PATH_DEPTH
+    
+    @classmethod
+    def get_trap_max_segment_repeats(cls) -> int:
+        return cls.TRAP_MAX_SEGMENT_REPEATS
+    
+    @classmethod
+    def get_trap_max_urls_per_pattern(cls) -> int:
+        return cls.TRAP_MAX_URLS_PER_PATTERN
+    
+    @classmethod
+    def get_trap_max_query_params(cls) -> int:
+        return cls.TRAP_MAX_QUERY_PARAMS
+    
+    @classmethod
+    def get_trap_max_query_variants(cls) -> int:
+        return cls.TRAP_MAX_QUERY_VARIANTS
+    
+    @classmethod
+    def get_trap_max_pages_per_host(cls) -> int:
+        return cls.TRAP_MAX_PAGES_PER_HOST
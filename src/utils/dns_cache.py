@@ -0,0 +1,153 @@
+import asyncio
+import ipaddress
+import socket
+import time
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.resolver import DefaultResolver
+
+from .config import Config
+
+CacheKey = Tuple[str, int]
+LookupOutcome = Union[List[ResolveResult], OSError]
+
+# Resolver answers that the host does not exist; other failures (timeouts, EAI_AGAIN) may be transient
+NAME_NOT_FOUND_ERRORS = {socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)}
+
+try:
+    # aiohttp's AsyncResolver, used when aiodns is installed, raises OSError(None, msg) from the aiodns error
+    from aiodns.error import ARES_ENODATA, ARES_ENOTFOUND, DNSError
+    ARES_NAME_NOT_FOUND_ERRORS = {ARES_ENOTFOUND, ARES_ENODATA}
+except ImportError:
+    DNSError = None
+    ARES_NAME_NOT_FOUND_ERRORS = set()
+
+# Queued prefetches allowed per concurrent prefetch slot before new ones are skipped
+PREFETCH_BACKLOG_FACTOR = 4
+
+
+class CachingResolver(AbstractResolver):
+    """Crawl-wide aiohttp resolver with TTL caching, negative caching and prefetch.
+
+    Lookups are cached per host and address family, independent of port. Lookups
+    of nonexistent hosts (NXDOMAIN) are cached for the negative TTL, so requests to
+    dead hosts fail immediately without a network attempt; transient failures are
+    not cached. Concurrent lookups of the same host share one in-flight query.
+    Prefetches run at most prefetch_concurrency at a time, so they do not crowd out
+    the lookups of actual fetches.
+    """
+
+    def __init__(self, ttl: Optional[int] = None, negative_ttl: Optional[int] = None, max_size: Optional[int] = None,
+                 prefetch_concurrency: Optional[int] = None):
+        self.ttl = Config.get_dns_cache_ttl() if ttl is None else ttl
+        self.negative_ttl = Config.get_dns_negative_ttl() if negative_ttl is None else negative_ttl
+        self.max_size = Config.get_dns_cache_max_size() if max_size is None else max_size
+        self.prefetch_concurrency = Config.get_dns_prefetch_concurrency() if prefetch_concurrency is None else prefetch_concurrency
+        self._prefetch_slots = asyncio.Semaphore(max(1, self.prefetch_concurrency))
+        self._resolver: Optional[AbstractResolver] = None
+        self._cache: Dict[CacheKey, Tuple[float, LookupOutcome]] = {}
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+        self._prefetches: Set[asyncio.Task] = set()
+
+    def _get_resolver(self) -> AbstractResolver:
+        # Created lazily: aiohttp resolvers bind to the running event loop
+        if self._resolver is None:
+            self._resolver = DefaultResolver()
+        return self._resolver
+
+    def _cached(self, key: CacheKey) -> Optional[LookupOutcome]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires, outcome = entry
+        if expires <= time.monotonic():
+            del self._cache[key]
+            return None
+        return outcome
+
+    def _store(self, key: CacheKey, outcome: LookupOutcome) -> None:
+        ttl = self.negative_ttl if isinstance(outcome, OSError) else self.ttl
+        if ttl <= 0:
+            return
+        if self._cache and len(self._cache) >= self.max_size:
+            # Evict the oldest entry
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + ttl, outcome)
+
+    async def _lookup(self, key: CacheKey) -> LookupOutcome:
+        host, family = key
+        try:
+            outcome = await self._get_resolver().resolve(host, 0, family)
+        except OSError as e:
+            outcome = e
+        finally:
+            self._inflight.pop(key, None)
+        if not isinstance(outcome, OSError) or self._is_name_not_found(outcome):
+            self._store(key, outcome)
+        return outcome
+
+    def _start_lookup(self, key: CacheKey) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.get_running_loop().create_task(self._lookup(key))
+        return task
+
+    async def resolve(self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET) -> List[ResolveResult]:
+        key = (host.lower(), family)
+        outcome = self._cached(key)
+        if outcome is None:
+            # Shielded so one cancelled request does not abort a lookup others are waiting on
+            outcome = await asyncio.shield(self._start_lookup(key))
+        if isinstance(outcome, OSError):
+            raise type(outcome)(*outcome.args)
+        return [{**record, 'port': port} for record in outcome]
+
+    def prefetch(self, host: Optional[str], family: socket.AddressFamily = socket.AF_UNSPEC) -> None:
+        """Start resolving a host in the background if it is not cached or already being resolved."""
+        if not host or self._is_ip_address(host):
+            return
+        key = (host.lower(), family)
+        if key in self._inflight or self._cached(key) is not None:
+            return
+        if self.prefetch_concurrency <= 0 or len(self._prefetches) >= self.prefetch_concurrency * PREFETCH_BACKLOG_FACTOR:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running event loop to prefetch on
+            return
+        task = loop.create_task(self._prefetch(key))
+        self._prefetches.add(task)
+        task.add_done_callback(self._prefetches.discard)
+
+    async def _prefetch(self, key: CacheKey) -> None:
+        async with self._prefetch_slots:
+            # A fetch may have resolved the host while this prefetch was waiting
+            if key in self._inflight or self._cached(key) is not None:
+                return
+            await self._start_lookup(key)
+
+    @staticmethod
+    def _is_name_not_found(error: OSError) -> bool:
+        if isinstance(error, socket.gaierror):
+            return error.errno in NAME_NOT_FOUND_ERRORS
+        cause = error.__cause__
+        return DNSError is not None and isinstance(cause, DNSError) and bool(cause.args) and cause.args[0] in ARES_NAME_NOT_FOUND_ERRORS
+
+    @staticmethod
+    def _is_ip_address(host: str) -> bool:
+        try:
+            ipaddress.ip_address(host.strip('[]'))
+            return True
+        except ValueError:
+            return False
+
+    async def close(self) -> None:
+        for task in [*self._prefetches, *self._inflight.values()]:
+            task.cancel()
+        self._prefetches.clear()
+        self._inflight.clear()
+        if self._resolver is not None:
+            await self._resolver.close()
+            self._resolver = None
@@ -1,10 +1,14 @@
 import csv
+import json
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
 from pathvalidate import sanitize_filename
 from tabulate import tabulate
 
 from ..app.models import CrawlProcessResult
+from ..app.link_graph import LinkGraph
 from .config import Config
 from ..utils import tsv_util, get_domain
 
@@ -14,16 +18,43 @@ def _get_job_path(root_url: str) -> Path:
     job_name = sanitize_filename(domain)[:255]
     return Path(Config.get_jobs_dir()) / job_name
 
-def save_scrape_content(root_url: str, url: str, content: str) -> str:
-    """Save scraped HTML content to a file."""
+SCRAPE_INDEX_FILENAME = 'index.jsonl'
+
+def save_scrape_content(root_url: str, url: str, content: str, depth: Optional[int] = None) -> str:
+    """Save scraped HTML content to a file and record it in the job's scrape index."""
     job_path = _get_job_path(root_url)
+    scrape_path = job_path / Config.get_scrape_dir()
     url_dir = sanitize_filename(url)[:255]
-    target_dir = job_path / Config.get_scrape_dir() / url_dir
+    target_dir = scrape_path / url_dir
     target_dir.mkdir(parents=True, exist_ok=True)
     file_path = target_dir / f"{sanitize_filename(url)[:255]}.html"
     file_path.write_text(content)
+    
+    # Sanitized filenames are lossy, so keep the original URL next to the content
+    entry = {'root_url': root_url, 'url': url, 'depth': depth, 'path': str(file_path.relative_to(scrape_path))}
+    with open(scrape_path / SCRAPE_INDEX_FILENAME, 'a') as index_file:
+        index_file.write(json.dumps(entry) + '\n')
     return str(file_path)
 
+def load_scrape_index(job_path: Path) -> List[Dict]:
+    """List stored scrape pages of a job, latest entry per URL.
+
+    Pages saved before the index existed are returned with url and depth set to None.
+    """
+    scrape_path = Path(job_path) / Config.get_scrape_dir()
+    index_path = scrape_path / SCRAPE_INDEX_FILENAME
+    entries: Dict[str, Dict] = {}
+    if index_path.exists():
+        for line in index_path.read_text().splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            entry['path'] = str(scrape_path / entry['path'])
+            entries[entry['path']] = entry
+    for html_path in scrape_path.glob('*/*.html'):
+        entries.setdefault(str(html_path), {'root_url': None, 'url': None, 'depth': None, 'path': str(html_path)})
+    return list(entries.values())
+
 def save_crawl_results(result: CrawlProcessResult) -> str:
     """Save crawl results to a TSV file."""
     job_path = _get_job_path(result.root_url)
@@ -35,4 +66,23 @@ def save_crawl_results(result: CrawlProcessResult) -> str:
     data = tsv_util.formulate(result)
     tsv = tabulate(data, headers='firstrow', tablefmt='tsv')
     file_path.write_text(tsv)
-    return str(file_path)
\ No newline at end of file
+    return str(file_path)
+
+def save_link_graph(root_url: str, graph: LinkGraph, rank: Optional[np.ndarray] = None) -> str:
+    """Save the link graph as a compressed NumPy archive, with per-domain aggregates as TSV."""
+    job_path = _get_job_path(root_url)
+    job_path.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    domain = get_domain(root_url) or root_url
+    file_stem = f"crawler_{sanitize_filename(domain)}_{timestamp}"
+    graph_path = job_path / f"{file_stem}_graph.npz"
+    graph.save(graph_path)
+    
+    stats = graph.domain_stats(rank)
+    columns = list(stats)
+    rows = [columns] + [
+        [stats['domain'][i]] + [f"{stats[column][i]:.6f}" if column == 'pagerank' else str(stats[column][i]) for column in columns[1:]]
+        for i in range(len(stats['domain']))
+    ]
+    (job_path / f"{file_stem}_domains.tsv").write_text(tabulate(rows, headers='firstrow', tablefmt='tsv'))
+    return str(graph_path)